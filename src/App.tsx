@@ -10,7 +10,16 @@ import Hardware from "./pages/Hardware";
 import Subsidies from "./pages/Subsidies";
 import NotFound from "./pages/NotFound";
 
-const queryClient = new QueryClient();
+const queryClient = new QueryClient({
+  defaultOptions: {
+    queries: {
+      // Dashboard data changes slowly; serve repeat mounts from the cache
+      // and keep entries around across page navigation
+      staleTime: 30_000,
+      gcTime: 5 * 60 * 1000,
+    },
+  },
+});
 
 const App = () => (
   <QueryClientProvider client={queryClient}>
@@ -16,6 +16,42 @@ interface WeatherData {
   rainfall: number;
 }
 
+// Static crop profiles; kept at module scope so they are built once, not
+// reallocated on every render
+const recommendedCrops = [
+  {
+    name: "Rice (धान)",
+    season: "Kharif",
+    suitability: 95,
+    reason: "High soil moisture and monsoon season",
+    yield: "4-5 tons/hectare",
+    duration: "120-150 days"
+  },
+  {
+    name: "Wheat (गेहूं)",
+    season: "Rabi",
+    suitability: 88,
+    reason: "Good soil pH and winter conditions",
+    yield: "3-4 tons/hectare",
+    duration: "110-130 days"
+  },
+  {
+    name: "Soybean (सोयाबीन)",
+    season: "Kharif",
+    suitability: 82,
+    reason: "Suitable nitrogen levels",
+    yield: "2-3 tons/hectare",
+    duration: "90-120 days"
+  }
+];
+
+const getCurrentSeason = () => {
+  const month = new Date().getMonth();
+  if (month >= 5 && month <= 9) return "Kharif 2024";
+  if (month >= 10 || month <= 2) return "Rabi 2024-25";
+  return "Zaid 2024";
+};
+
 const CropRecommendation = () => {
   const [weather, setWeather] = useState<WeatherData | null>(null);
   const [loading, setLoading] = useState(true);
@@ -45,39 +81,6 @@ const CropRecommendation = () => {
 
     fetchWeather();
   }, [toast]);
-  const recommendedCrops = [
-    {
-      name: "Rice (धान)",
-      season: "Kharif",
-      suitability: 95,
-      reason: "High soil moisture and monsoon season",
-      yield: "4-5 tons/hectare",
-      duration: "120-150 days"
-    },
-    {
-      name: "Wheat (गेहूं)",
-      season: "Rabi",
-      suitability: 88,
-      reason: "Good soil pH and winter conditions",
-      yield: "3-4 tons/hectare",
-      duration: "110-130 days"
-    },
-    {
-      name: "Soybean (सोयाबीन)",
-      season: "Kharif",
-      suitability: 82,
-      reason: "Suitable nitrogen levels",
-      yield: "2-3 tons/hectare",
-      duration: "90-120 days"
-    }
-  ];
-
-  const getCurrentSeason = () => {
-    const month = new Date().getMonth();
-    if (month >= 5 && month <= 9) return "Kharif 2024";
-    if (month >= 10 || month <= 2) return "Rabi 2024-25";
-    return "Zaid 2024";
-  };
 
   const conditions = weather ? [
     { icon: Thermometer, label: "Temperature", value: `${weather.temperature}°C`, color: "text-destructive" },
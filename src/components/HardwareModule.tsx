@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
@@ -7,19 +7,43 @@ import { Switch } from "@/components/ui/switch";
 import { useToast } from "@/hooks/use-toast";
 import { Droplets, Thermometer, Gauge, Power, Wifi, WifiOff } from "lucide-react";
 import mqtt from "mqtt";
+import { z } from "zod";
+import { useQueryClient } from "@tanstack/react-query";
+import { supabase } from "@/integrations/supabase/client";
+import type { TablesInsert } from "@/integrations/supabase/types";
+import { analyzeSensorData, type SensorData } from "@/lib/soilHealth";
+import { sensorQueryKeys, type LatestReading } from "@/hooks/use-sensor-readings";
 
-interface SensorData {
-  soilMoisture: number;
-  soilPH: number;
-  nitrogen: number;
-  phosphorus: number;
-  potassium: number;
-  temperature: number;
-  humidity: number;
-}
+// Compiled once; coerces numeric strings from lightweight firmware and
+// falls back to safe defaults for missing or malformed fields
+const sensorPayloadSchema = z.object({
+  soilMoisture: z.coerce.number().catch(0),
+  soilPH: z.coerce.number().catch(7.0),
+  nitrogen: z.coerce.number().catch(0),
+  phosphorus: z.coerce.number().catch(0),
+  potassium: z.coerce.number().catch(0),
+  temperature: z.coerce.number().catch(0),
+  humidity: z.coerce.number().catch(0),
+});
+
+// Readings are buffered and written to Supabase in bulk so a fast-publishing
+// module doesn't turn into one insert round trip per MQTT message
+const READING_BATCH_SIZE = 10;
+// Slow publishers still get their partial batch flushed on this interval
+const READING_FLUSH_MS = 5000;
+
+// The two control payloads never vary; build them once instead of
+// serializing a fresh object on every toggle
+const IRRIGATION_ON_PAYLOAD = JSON.stringify({ active: true });
+const IRRIGATION_OFF_PAYLOAD = JSON.stringify({ active: false });
+
+// Display updates are coalesced to this interval so a fast-publishing
+// module doesn't force a React render per MQTT message
+const SENSOR_RENDER_MS = 250;
 
 const HardwareModule = () => {
   const { toast } = useToast();
+  const queryClient = useQueryClient();
   const [isConnected, setIsConnected] = useState(false);
   const [mqttBroker, setMqttBroker] = useState("mqtt://broker.hivemq.com");
   const [mqttTopic, setMqttTopic] = useState("agribio/sensors");
@@ -34,6 +58,33 @@ const HardwareModule = () => {
     humidity: 0,
   });
   const [irrigationActive, setIrrigationActive] = useState(false);
+  const pendingReadings = useRef<TablesInsert<"sensor_readings">[]>([]);
+  const latestReading = useRef<SensorData | null>(null);
+
+  const flushReadings = async () => {
+    if (pendingReadings.current.length === 0) return;
+    const rows = pendingReadings.current;
+    pendingReadings.current = [];
+    const { error } = await supabase.from("sensor_readings").insert(rows);
+    if (error) {
+      console.error("Error saving sensor readings:", error);
+      return;
+    }
+
+    // The writer knows the newest reading, so update the dashboard cache
+    // in place instead of letting it refetch what we just wrote
+    const last = rows[rows.length - 1];
+    queryClient.setQueryData<LatestReading | null>(sensorQueryKeys.latest, {
+      health_index: last.health_index,
+      health_status: last.health_status,
+      soil_ph: last.soil_ph,
+      nitrogen: last.nitrogen,
+      phosphorus: last.phosphorus,
+      potassium: last.potassium,
+    });
+    queryClient.invalidateQueries({ queryKey: sensorQueryKeys.stats });
+    queryClient.invalidateQueries({ queryKey: sensorQueryKeys.history });
+  };
 
   const connectToMQTT = () => {
     try {
@@ -50,16 +101,29 @@ const HardwareModule = () => {
 
       mqttClient.on("message", (topic, message) => {
         try {
-          const data = JSON.parse(message.toString());
-          setSensorData({
-            soilMoisture: data.soilMoisture || 0,
-            soilPH: data.soilPH || 7.0,
-            nitrogen: data.nitrogen || 0,
-            phosphorus: data.phosphorus || 0,
-            potassium: data.potassium || 0,
-            temperature: data.temperature || 0,
-            humidity: data.humidity || 0,
+          const reading: SensorData = sensorPayloadSchema.parse(
+            JSON.parse(message.toString())
+          );
+          latestReading.current = reading;
+
+          const analysis = analyzeSensorData(reading);
+          pendingReadings.current.push({
+            soil_moisture: reading.soilMoisture,
+            soil_ph: reading.soilPH,
+            nitrogen: reading.nitrogen,
+            phosphorus: reading.phosphorus,
+            potassium: reading.potassium,
+            temperature: reading.temperature,
+            humidity: reading.humidity,
+            health_index: analysis.healthIndex,
+            health_status: analysis.healthStatus,
+            is_anomalous: analysis.isAnomalous,
+            anomaly_score: analysis.anomalyScore,
+            critical_factors: analysis.criticalFactorsMask,
           });
+          if (pendingReadings.current.length >= READING_BATCH_SIZE) {
+            flushReadings();
+          }
         } catch (error) {
           console.error("Error parsing MQTT message:", error);
         }
@@ -85,6 +149,7 @@ const HardwareModule = () => {
 
   const disconnect = () => {
     if (client) {
+      flushReadings();
       client.end();
       setClient(null);
       setIsConnected(false);
@@ -98,7 +163,10 @@ const HardwareModule = () => {
   const toggleIrrigation = (enabled: boolean) => {
     setIrrigationActive(enabled);
     if (client && isConnected) {
-      client.publish("agribio/control/irrigation", JSON.stringify({ active: enabled }));
+      client.publish(
+        "agribio/control/irrigation",
+        enabled ? IRRIGATION_ON_PAYLOAD : IRRIGATION_OFF_PAYLOAD
+      );
       toast({
         title: enabled ? "Irrigation Started" : "Irrigation Stopped",
         description: `Irrigation system ${enabled ? "activated" : "deactivated"}`,
@@ -107,11 +175,21 @@ const HardwareModule = () => {
   };
 
   useEffect(() => {
-    return () => {
-      if (client) {
-        client.end();
+    if (!client) return;
+    const flushTimer = setInterval(flushReadings, READING_FLUSH_MS);
+    const renderTimer = setInterval(() => {
+      if (latestReading.current) {
+        setSensorData(latestReading.current);
+        latestReading.current = null;
       }
+    }, SENSOR_RENDER_MS);
+    return () => {
+      clearInterval(flushTimer);
+      clearInterval(renderTimer);
+      flushReadings();
+      client.end();
     };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [client]);
 
   return (
@@ -2,9 +2,20 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/com
 import { Button } from "@/components/ui/button";
 import { Progress } from "@/components/ui/progress";
 import { Activity, Droplets, Leaf, TrendingUp } from "lucide-react";
+import { Line, LineChart, ResponsiveContainer, Tooltip, XAxis, YAxis } from "recharts";
+import {
+  useLatestReading,
+  useSensorHistory,
+  useSensorStats,
+} from "@/hooks/use-sensor-readings";
 
 const SoilHealthReport = () => {
-  const soilHealthIndex = 72; // Example value
+  const { data: latest } = useLatestReading();
+  const { data: history = [] } = useSensorHistory();
+  const { data: stats } = useSensorStats();
+
+  // Example values shown until the hardware module has recorded a reading
+  const soilHealthIndex = latest?.health_index ?? 72;
 
   const getHealthColor = (value: number) => {
     if (value >= 70) return "bg-field";
@@ -65,16 +76,28 @@ const SoilHealthReport = () => {
                   <p className="text-sm text-muted-foreground mt-2">
                     {soilHealthIndex >= 70 ? "Good" : soilHealthIndex >= 40 ? "Moderate" : "Needs Improvement"}
                   </p>
+                  {stats && stats.total_readings > 0 && (
+                    <p className="text-sm text-muted-foreground mt-1">
+                      Average {Math.round(stats.health_index_sum / stats.total_readings)} across{" "}
+                      {stats.total_readings} readings · {stats.anomaly_count} anomalies
+                    </p>
+                  )}
                 </div>
 
                 <div className="grid grid-cols-3 gap-4 pt-4 border-t">
                   <div>
                     <p className="text-xs text-muted-foreground">pH Level</p>
-                    <p className="text-lg font-semibold text-foreground">6.5</p>
+                    <p className="text-lg font-semibold text-foreground">
+                      {latest ? latest.soil_ph.toFixed(1) : "6.5"}
+                    </p>
                   </div>
                   <div>
                     <p className="text-xs text-muted-foreground">N-P-K</p>
-                    <p className="text-lg font-semibold text-foreground">240:45:180</p>
+                    <p className="text-lg font-semibold text-foreground">
+                      {latest
+                        ? `${Math.round(latest.nitrogen)}:${Math.round(latest.phosphorus)}:${Math.round(latest.potassium)}`
+                        : "240:45:180"}
+                    </p>
                   </div>
                   <div>
                     <p className="text-xs text-muted-foreground">Organic %</p>
@@ -111,6 +134,43 @@ const SoilHealthReport = () => {
             ))}
           </div>
         </div>
+
+        {history.length > 0 && (
+          <Card className="max-w-5xl mx-auto mt-8 shadow-medium">
+            <CardHeader>
+              <CardTitle className="flex items-center gap-2">
+                <Activity className="h-6 w-6 text-primary" />
+                Health Index Trend
+              </CardTitle>
+              <CardDescription>Recent readings from your Agribio module</CardDescription>
+            </CardHeader>
+            <CardContent>
+              <div className="h-[200px]">
+                <ResponsiveContainer width="100%" height="100%">
+                  <LineChart data={history}>
+                    <XAxis
+                      dataKey="created_at"
+                      tickFormatter={(value: string) => new Date(value).toLocaleTimeString()}
+                      tick={{ fontSize: 12 }}
+                    />
+                    <YAxis domain={[0, 100]} tick={{ fontSize: 12 }} width={32} />
+                    <Tooltip
+                      labelFormatter={(value: string) => new Date(value).toLocaleString()}
+                      formatter={(value: number) => [value, "Health Index"]}
+                    />
+                    <Line
+                      type="monotone"
+                      dataKey="health_index"
+                      stroke="hsl(var(--primary))"
+                      strokeWidth={2}
+                      dot={false}
+                    />
+                  </LineChart>
+                </ResponsiveContainer>
+              </div>
+            </CardContent>
+          </Card>
+        )}
       </div>
     </section>
   );
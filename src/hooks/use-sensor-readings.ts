@@ -0,0 +1,95 @@
+import { useQuery } from "@tanstack/react-query";
+import { supabase } from "@/integrations/supabase/client";
+
+export interface LatestReading {
+  health_index: number;
+  health_status: string;
+  soil_ph: number;
+  nitrogen: number;
+  phosphorus: number;
+  potassium: number;
+}
+
+export interface HistoryPoint {
+  id: number;
+  health_index: number;
+  created_at: string;
+}
+
+export interface SensorStats {
+  total_readings: number;
+  health_index_sum: number;
+  anomaly_count: number;
+}
+
+// Bounded window of recent readings for the trend chart; the query is
+// served straight from the database with LIMIT, never a full-table read
+export const HISTORY_LIMIT = 50;
+
+// Sensor data only changes while a hardware module is connected, so repeat
+// visits within this window are served from the query cache instead of
+// refetching on every mount
+const SENSOR_STALE_MS = 30_000;
+
+export const sensorQueryKeys = {
+  latest: ["sensor-readings", "latest"] as const,
+  history: ["sensor-readings", "history"] as const,
+  stats: ["sensor-readings", "stats"] as const,
+};
+
+export function useLatestReading() {
+  return useQuery({
+    queryKey: sensorQueryKeys.latest,
+    queryFn: async (): Promise<LatestReading | null> => {
+      // id is insertion-monotonic, so ordering by the primary key picks the
+      // newest reading without sorting timestamp ties
+      const { data, error } = await supabase
+        .from("sensor_readings")
+        .select("health_index, health_status, soil_ph, nitrogen, phosphorus, potassium")
+        .order("id", { ascending: false })
+        .limit(1)
+        .maybeSingle();
+
+      if (error) throw error;
+      return data;
+    },
+    staleTime: SENSOR_STALE_MS,
+  });
+}
+
+export function useSensorHistory() {
+  return useQuery({
+    queryKey: sensorQueryKeys.history,
+    queryFn: async (): Promise<HistoryPoint[]> => {
+      const { data, error } = await supabase
+        .from("sensor_readings")
+        .select("id, health_index, created_at")
+        .order("id", { ascending: false })
+        .limit(HISTORY_LIMIT);
+
+      if (error) throw error;
+      // Fetched newest-first to use the index; display oldest-first
+      return (data || []).reverse();
+    },
+    staleTime: SENSOR_STALE_MS,
+  });
+}
+
+export function useSensorStats() {
+  return useQuery({
+    queryKey: sensorQueryKeys.stats,
+    queryFn: async (): Promise<SensorStats | null> => {
+      // Single-row summary maintained by a database trigger on ingest, so
+      // this stays O(1) no matter how many readings accumulate
+      const { data, error } = await supabase
+        .from("sensor_stats")
+        .select("total_readings, health_index_sum, anomaly_count")
+        .eq("id", 1)
+        .maybeSingle();
+
+      if (error) throw error;
+      return data;
+    },
+    staleTime: SENSOR_STALE_MS,
+  });
+}
@@ -14,6 +14,90 @@ export type Database = {
   }
   public: {
     Tables: {
+      sensor_readings: {
+        Row: {
+          anomaly_score: number
+          created_at: string
+          critical_factors: number
+          health_index: number
+          health_status: string
+          humidity: number
+          id: number
+          is_anomalous: boolean
+          nitrogen: number
+          phosphorus: number
+          potassium: number
+          soil_moisture: number
+          soil_ph: number
+          temperature: number
+        }
+        Insert: {
+          anomaly_score?: number
+          created_at?: string
+          critical_factors?: number
+          health_index: number
+          health_status: string
+          humidity: number
+          id?: never
+          is_anomalous?: boolean
+          nitrogen: number
+          phosphorus: number
+          potassium: number
+          soil_moisture: number
+          soil_ph: number
+          temperature: number
+        }
+        Update: {
+          anomaly_score?: number
+          created_at?: string
+          critical_factors?: number
+          health_index?: number
+          health_status?: string
+          humidity?: number
+          id?: never
+          is_anomalous?: boolean
+          nitrogen?: number
+          phosphorus?: number
+          potassium?: number
+          soil_moisture?: number
+          soil_ph?: number
+          temperature?: number
+        }
+        Relationships: []
+      }
+      sensor_stats: {
+        Row: {
+          anomaly_count: number
+          good_count: number
+          health_index_sum: number
+          id: number
+          moderate_count: number
+          needs_improvement_count: number
+          total_readings: number
+          updated_at: string
+        }
+        Insert: {
+          anomaly_count?: number
+          good_count?: number
+          health_index_sum?: number
+          id?: number
+          moderate_count?: number
+          needs_improvement_count?: number
+          total_readings?: number
+          updated_at?: string
+        }
+        Update: {
+          anomaly_count?: number
+          good_count?: number
+          health_index_sum?: number
+          id?: number
+          moderate_count?: number
+          needs_improvement_count?: number
+          total_readings?: number
+          updated_at?: string
+        }
+        Relationships: []
+      }
       subsidies: {
         Row: {
           amount: string
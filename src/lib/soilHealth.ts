@@ -0,0 +1,88 @@
+export interface SensorData {
+  soilMoisture: number;
+  soilPH: number;
+  nitrogen: number;
+  phosphorus: number;
+  potassium: number;
+  temperature: number;
+  humidity: number;
+}
+
+export interface SoilAnalysis {
+  healthIndex: number;
+  healthStatus: string;
+  isAnomalous: boolean;
+  anomalyScore: number;
+  criticalFactorsMask: number;
+}
+
+// Static scoring table, built once at module load with the derived values
+// (center, half-range, span) precomputed. Entry order defines the bit
+// position used in critical_factors masks.
+const SENSOR_PARAMETERS = (
+  [
+    ["nitrogen", "Nitrogen", 15, 30, 1],
+    ["phosphorus", "Phosphorus", 10, 25, 1],
+    ["potassium", "Potassium", 100, 200, 1],
+    ["temperature", "Temperature", 15, 25, 0.9],
+    ["humidity", "Humidity", 40, 80, 0.8],
+    ["soilMoisture", "Soil Moisture", 40, 60, 1],
+    ["soilPH", "Soil pH", 6.5, 7.5, 1],
+  ] as const
+).map(([key, label, min, max, weight]) => ({
+  key: key as keyof SensorData,
+  label,
+  min,
+  max,
+  weight,
+  center: (min + max) / 2,
+  half: (max - min) / 2,
+  span: max - min,
+}));
+
+const TOTAL_WEIGHT = SENSOR_PARAMETERS.reduce((sum, param) => sum + param.weight, 0);
+
+export const CRITICAL_FACTOR_LABELS = SENSOR_PARAMETERS.map((param) => param.label);
+
+export function decodeCriticalFactors(mask: number): string[] {
+  return CRITICAL_FACTOR_LABELS.filter((_, index) => (mask >> index) & 1);
+}
+
+export function analyzeSensorData(data: SensorData): SoilAnalysis {
+  let total = 0;
+  let maxDeviation = 0;
+  let criticalFactorsMask = 0;
+
+  for (let i = 0; i < SENSOR_PARAMETERS.length; i++) {
+    const { key, min, max, weight, center, half, span } = SENSOR_PARAMETERS[i];
+    const value = data[key];
+
+    // Score falls linearly from 100 at the center to 50 at the range
+    // boundary, then keeps decaying past it, so the two branches meet at
+    // the boundary and the score is monotonic in distance from center
+    if (value >= min && value <= max) {
+      total += (100 - (Math.abs(value - center) / half) * 50) * weight;
+    } else {
+      const overshoot = value < min ? min - value : value - max;
+      total += Math.max(0, 50 - overshoot * 5) * weight;
+      criticalFactorsMask |= 1 << i;
+      const deviation = overshoot / span;
+      if (deviation > maxDeviation) {
+        maxDeviation = deviation;
+      }
+    }
+  }
+
+  const healthIndex = Math.round(total / TOTAL_WEIGHT);
+  const healthStatus =
+    healthIndex >= 70 ? "Good" : healthIndex >= 40 ? "Moderate" : "Needs Improvement";
+  const anomalyScore = Math.round(maxDeviation * 100) / 100;
+
+  return {
+    healthIndex,
+    healthStatus,
+    isAnomalous: anomalyScore > 0.5,
+    anomalyScore,
+    criticalFactorsMask,
+  };
+}
@@ -5,6 +5,38 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 };
 
+// Upstream timeout; a stalled OpenWeather connection would otherwise hold
+// the function (and the caller's loading state) for the platform default
+const WEATHER_FETCH_TIMEOUT_MS = 5000;
+
+// Weather is meaningful at minute granularity; while the isolate is warm,
+// repeat lookups for nearby coordinates are served from memory instead of
+// calling OpenWeather again
+const WEATHER_CACHE_TTL_MS = 5 * 60 * 1000;
+const WEATHER_CACHE_MAX_ENTRIES = 256;
+const weatherCache = new Map<string, { data: unknown; expires: number }>();
+
+// Successful responses are also cacheable client-side for the same window,
+// so polling dashboards skip the request entirely on repeats
+const cacheableJsonHeaders = {
+  'Content-Type': 'application/json',
+  'Cache-Control': 'public, max-age=300',
+};
+
+// Declared once, used per request: coerces and range-checks coordinates so
+// malformed input is rejected before any upstream work
+function parseCoordinates(body: { lat?: unknown; lon?: unknown } | null) {
+  const lat = Number(body?.lat);
+  const lon = Number(body?.lon);
+  if (
+    !Number.isFinite(lat) || lat < -90 || lat > 90 ||
+    !Number.isFinite(lon) || lon < -180 || lon > 180
+  ) {
+    return null;
+  }
+  return { lat, lon };
+}
+
 serve(async (req) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -12,14 +44,24 @@ serve(async (req) => {
   }
 
   try {
-    const { lat, lon } = await req.json();
-
-    if (!lat || !lon) {
+    const coords = parseCoordinates(await req.json());
+    if (!coords) {
       return new Response(
-        JSON.stringify({ error: 'Latitude and longitude are required' }),
+        JSON.stringify({ error: 'Valid latitude and longitude are required' }),
         { status: 400, headers: { ...corsHeaders, 'Content-Type': 'application/json' } }
       );
     }
+    const { lat, lon } = coords;
+
+    // ~1 km granularity is plenty for weather data
+    const cacheKey = `${lat.toFixed(2)},${lon.toFixed(2)}`;
+    const cached = weatherCache.get(cacheKey);
+    if (cached && cached.expires > Date.now()) {
+      return new Response(
+        JSON.stringify(cached.data),
+        { headers: { ...corsHeaders, ...cacheableJsonHeaders } }
+      );
+    }
 
     const apiKey = Deno.env.get('OPENWEATHER_API_KEY');
     if (!apiKey) {
@@ -32,7 +74,9 @@ serve(async (req) => {
 
     // Fetch current weather
     const weatherUrl = `https://api.openweathermap.org/data/2.5/weather?lat=${lat}&lon=${lon}&appid=${apiKey}&units=metric`;
-    const weatherResponse = await fetch(weatherUrl);
+    const weatherResponse = await fetch(weatherUrl, {
+      signal: AbortSignal.timeout(WEATHER_FETCH_TIMEOUT_MS),
+    });
 
     if (!weatherResponse.ok) {
       console.error('OpenWeather API error:', await weatherResponse.text());
@@ -55,11 +99,25 @@ serve(async (req) => {
       rainfall: weatherData.rain ? weatherData.rain['1h'] || 0 : 0,
     };
 
-    console.log('Weather data fetched successfully:', formattedData);
+    if (weatherCache.size >= WEATHER_CACHE_MAX_ENTRIES) {
+      const now = Date.now();
+      for (const [key, entry] of weatherCache) {
+        if (entry.expires <= now) weatherCache.delete(key);
+      }
+      // Everything may still be fresh; drop the oldest entry (Map keeps
+      // insertion order) so the cap actually holds
+      if (weatherCache.size >= WEATHER_CACHE_MAX_ENTRIES) {
+        weatherCache.delete(weatherCache.keys().next().value!);
+      }
+    }
+    weatherCache.set(cacheKey, {
+      data: formattedData,
+      expires: Date.now() + WEATHER_CACHE_TTL_MS,
+    });
 
     return new Response(
       JSON.stringify(formattedData),
-      { headers: { ...corsHeaders, 'Content-Type': 'application/json' } }
+      { headers: { ...corsHeaders, ...cacheableJsonHeaders } }
     );
   } catch (error) {
     console.error('Error in get-weather function:', error);
@@ -0,0 +1,32 @@
+-- Create sensor_readings table for Agribio hardware telemetry
+CREATE TABLE public.sensor_readings (
+  id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+  nitrogen NUMERIC NOT NULL,
+  phosphorus NUMERIC NOT NULL,
+  potassium NUMERIC NOT NULL,
+  temperature NUMERIC NOT NULL,
+  humidity NUMERIC NOT NULL,
+  soil_moisture NUMERIC NOT NULL,
+  soil_ph NUMERIC NOT NULL,
+  health_index INTEGER NOT NULL,
+  health_status TEXT NOT NULL,
+  is_anomalous BOOLEAN NOT NULL DEFAULT false,
+  anomaly_score NUMERIC NOT NULL DEFAULT 0,
+  critical_factors JSONB NOT NULL DEFAULT '[]'::jsonb,
+  created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
+
+-- Enable Row Level Security
+ALTER TABLE public.sensor_readings ENABLE ROW LEVEL SECURITY;
+
+-- Create policy for public read access (readings feed the public dashboard)
+CREATE POLICY "Sensor readings are viewable by everyone"
+ON public.sensor_readings
+FOR SELECT
+USING (true);
+
+-- Create policy for inserts (hardware modules push readings with the publishable key)
+CREATE POLICY "Sensor readings can be inserted by everyone"
+ON public.sensor_readings
+FOR INSERT
+WITH CHECK (true);
@@ -0,0 +1,61 @@
+-- Create single-row summary table so stats reads are O(1) instead of
+-- scanning sensor_readings
+CREATE TABLE public.sensor_stats (
+  id INTEGER NOT NULL PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+  total_readings BIGINT NOT NULL DEFAULT 0,
+  health_index_sum BIGINT NOT NULL DEFAULT 0,
+  anomaly_count BIGINT NOT NULL DEFAULT 0,
+  good_count BIGINT NOT NULL DEFAULT 0,
+  moderate_count BIGINT NOT NULL DEFAULT 0,
+  needs_improvement_count BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
+
+-- Enable Row Level Security
+ALTER TABLE public.sensor_stats ENABLE ROW LEVEL SECURITY;
+
+-- Create policy for public read access (stats feed the public dashboard)
+CREATE POLICY "Sensor stats are viewable by everyone"
+ON public.sensor_stats
+FOR SELECT
+USING (true);
+
+-- Seed the summary row from any readings already recorded
+INSERT INTO public.sensor_stats (
+  id, total_readings, health_index_sum, anomaly_count,
+  good_count, moderate_count, needs_improvement_count
+)
+SELECT
+  1,
+  COUNT(*),
+  COALESCE(SUM(health_index), 0),
+  COUNT(*) FILTER (WHERE is_anomalous),
+  COUNT(*) FILTER (WHERE health_status = 'Good'),
+  COUNT(*) FILTER (WHERE health_status = 'Moderate'),
+  COUNT(*) FILTER (WHERE health_status = 'Needs Improvement')
+FROM public.sensor_readings;
+
+-- Create function to fold each new reading into the running summary.
+-- SECURITY DEFINER so the update works when the inserting role (anon)
+-- has no write policy on sensor_stats.
+CREATE OR REPLACE FUNCTION public.update_sensor_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE public.sensor_stats SET
+    total_readings = total_readings + 1,
+    health_index_sum = health_index_sum + NEW.health_index,
+    anomaly_count = anomaly_count + CASE WHEN NEW.is_anomalous THEN 1 ELSE 0 END,
+    good_count = good_count + CASE WHEN NEW.health_status = 'Good' THEN 1 ELSE 0 END,
+    moderate_count = moderate_count + CASE WHEN NEW.health_status = 'Moderate' THEN 1 ELSE 0 END,
+    needs_improvement_count = needs_improvement_count + CASE WHEN NEW.health_status = 'Needs Improvement' THEN 1 ELSE 0 END,
+    updated_at = now()
+  WHERE id = 1;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Create trigger to keep the summary current on ingest
+CREATE TRIGGER update_sensor_stats_on_insert
+AFTER INSERT ON public.sensor_readings
+FOR EACH ROW
+EXECUTE FUNCTION public.update_sensor_stats();
@@ -0,0 +1,20 @@
+-- Store critical factors as a 7-bit mask instead of a JSONB name array.
+-- The vocabulary is fixed, so a SMALLINT is smaller per row and lets
+-- filters use a constant-time bit test instead of JSONB containment.
+-- Bit order matches the parameter table in src/lib/soilHealth.ts.
+ALTER TABLE public.sensor_readings
+  ADD COLUMN critical_factors_mask SMALLINT NOT NULL DEFAULT 0;
+
+UPDATE public.sensor_readings SET critical_factors_mask =
+  (CASE WHEN critical_factors ? 'Nitrogen' THEN 1 ELSE 0 END)
+  | (CASE WHEN critical_factors ? 'Phosphorus' THEN 2 ELSE 0 END)
+  | (CASE WHEN critical_factors ? 'Potassium' THEN 4 ELSE 0 END)
+  | (CASE WHEN critical_factors ? 'Temperature' THEN 8 ELSE 0 END)
+  | (CASE WHEN critical_factors ? 'Humidity' THEN 16 ELSE 0 END)
+  | (CASE WHEN critical_factors ? 'Soil Moisture' THEN 32 ELSE 0 END)
+  | (CASE WHEN critical_factors ? 'Soil pH' THEN 64 ELSE 0 END);
+
+ALTER TABLE public.sensor_readings DROP COLUMN critical_factors;
+
+ALTER TABLE public.sensor_readings
+  RENAME COLUMN critical_factors_mask TO critical_factors;
@@ -0,0 +1,14 @@
+-- Tighten sensor_readings column types. Sensor measurements fit
+-- single-precision floats, so fixed-width REAL replaces variable-length
+-- NUMERIC, and the 0-100 health index fits a SMALLINT. Smaller rows mean
+-- more tuples per page on the hot latest/history reads.
+ALTER TABLE public.sensor_readings
+  ALTER COLUMN nitrogen TYPE REAL,
+  ALTER COLUMN phosphorus TYPE REAL,
+  ALTER COLUMN potassium TYPE REAL,
+  ALTER COLUMN temperature TYPE REAL,
+  ALTER COLUMN humidity TYPE REAL,
+  ALTER COLUMN soil_moisture TYPE REAL,
+  ALTER COLUMN soil_ph TYPE REAL,
+  ALTER COLUMN anomaly_score TYPE REAL,
+  ALTER COLUMN health_index TYPE SMALLINT;
@@ -0,0 +1,9 @@
+-- Index the read paths on sensor_readings: time-windowed queries walk
+-- created_at descending, and anomaly lookups only care about the rare
+-- is_anomalous rows, so a partial index keeps that one small
+CREATE INDEX idx_sensor_readings_created_at
+ON public.sensor_readings (created_at DESC);
+
+CREATE INDEX idx_sensor_readings_anomalous
+ON public.sensor_readings (id)
+WHERE is_anomalous;